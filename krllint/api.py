@@ -7,6 +7,15 @@ from .tools import get_parameters
 
 RULES = {"common": [], "code": [], "comment": []}
 
+# Maps the name of the first parameter of a rule's lint method to its group
+RULE_GROUPS = {
+    "line": "common",
+    "code_line": "code",
+    "comment_line": "comment"
+}
+
+_REGISTERED_RULES = set()
+
 
 class RuleMeta(ABCMeta):
     def __new__(cls, name, bases, namespace, **kwargs):
@@ -21,12 +30,14 @@ class RuleMeta(ABCMeta):
         if len(params) <= 1:
             return rule
 
-        if params[1] == "line" and rule not in RULES["common"]:
-            RULES["common"].append(rule())
-        elif params[1] == "code_line" and rule not in RULES["code"]:
-            RULES["code"].append(rule())
-        elif params[1] == "comment_line" and rule not in RULES["comment"]:
-            RULES["comment"].append(rule())
+        group = RULE_GROUPS.get(params[1])
+        name = f"{rule.__module__}.{rule.__qualname__}"
+
+        # Registered by name, a module which is imported again must not
+        # add a second instance of its rules.
+        if group and name not in _REGISTERED_RULES:
+            _REGISTERED_RULES.add(name)
+            RULES[group].append(rule())
 
         return rule
 
@@ -34,7 +45,17 @@ class RuleMeta(ABCMeta):
 class BaseRule(metaclass=RuleMeta):
     """
     Encapsulates a method to lint and a method to fix a possibly found issue.
+
+    Rules whose lint results only depend on the content of the checked line
+    (and the configuration) can set CACHEABLE to True. The results of
+    identical lines are then reused instead of linted again.
+
+    Rules should list the identifiers of all issues they report in CODES. A
+    rule whose codes are all disabled in the configuration is not run.
     """
+    CACHEABLE = False
+    CODES = ()
+
     @abstractmethod
     def lint(self):
         """
@@ -56,12 +77,14 @@ class BaseRule(metaclass=RuleMeta):
     @abstractmethod
     def fix(self):
         """
-        Fixes the found issue.
+        Fixes the found issues.
 
-        This method is dynamically called by class:: StyleChecker().
+        This method is dynamically called by class:: StyleChecker() once per
+        line in which the rule reported issues, even if it reported several.
         Possible arguemts are:
           - All attributes of class:: CheckerParameters
           - All attributes defined in the configuration file
 
-        This method must return the fixed line.
+        This method must return the line with all issues fixed which the rule
+        reported in it.
         """
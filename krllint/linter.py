@@ -5,14 +5,20 @@ Checks and automatically fixes KRL (KUKA Robot Language) code.
 """
 
 import os
-from argparse import ArgumentParser, Action
+from argparse import ArgumentParser, ArgumentTypeError, Action
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from itertools import chain, islice
+from operator import attrgetter
+from types import SimpleNamespace
 
 import krllint
 import krllint.rules
 from .tools import get_parameters
 from .parameters import Parameters
 from .api import RULES
-from .reporter import Message
+from .reporter import Message, MemoryReporter
 
 
 class Linter:
@@ -34,98 +40,343 @@ class Linter:
 
         self._parameters = Parameters(self.config)
         self._reporter = self.config.REPORTER()
+        self._lint_results = {}
+
+        disabled = frozenset(self.config.DISABLE)
+        self._rules = _create_rule_sequences(
+            *(tuple(_bind_rule(rule, disabled, self.cli_args.fix)
+                    for rule in RULES[group]
+                    if not _is_rule_disabled(rule, disabled))
+              for group in ("common", "code", "comment")))
+
+    @property
+    def jobs(self):
+        return getattr(self.cli_args, "jobs", 1) or os.cpu_count() or 1
 
     def lint(self):
-        for target in self.cli_args.target:
-            target = os.path.expanduser(target)
-            if os.path.isdir(target):
-                self.lint_directory(target)
-            else:
-                self.lint_file(target)
+        # Files of overlapping targets are only linted for the first target
+        # which contains them, no matter how many jobs are used.
+        target_files = _remove_duplicate_files(
+            [_find_target_files(os.path.expanduser(target), self.extensions)
+             for target in self.cli_args.target])
+
+        if (self.jobs > 1 and
+                sum(map(len, target_files)) >= PARALLEL_MIN_FILES):
+            self._lint_targets_in_parallel(target_files)
+            return
 
+        for filenames in target_files:
+            self._lint_files(filenames)
             self._reporter.finalize()
 
     def lint_directory(self, dirname):
-        for dirpath, _, filenames in os.walk(dirname):
-            for filename in sorted(filter(
-                    lambda file: file.endswith(self.extensions), filenames)):
-                self.lint_file(os.path.join(dirpath, filename))
+        filenames = _find_files(dirname, self.extensions)
 
-    def lint_file(self, filename):
-        self._reporter.start_file(filename)
+        if self.jobs > 1:
+            filenames = list(filenames)
+            if len(filenames) >= PARALLEL_MIN_FILES:
+                self._lint_files_in_parallel(filenames)
+                return
 
-        lines = []
-        with open(filename) as content:
-            lines = content.readlines()
+        self._lint_files(filenames)
 
-        self.lint_lines(filename, lines)
+    def _lint_files(self, filenames):
+        for filename, lines in _read_files_ahead(filenames):
+            self._lint_file(filename, lines)
+
+    def lint_file(self, filename):
+        return self._lint_file(filename, _read_lines(filename))
+
+    def _lint_file(self, filename, lines):
+        # The freshly read lines are not shared with anyone, so they are
+        # fixed in place instead of being copied like in lint_lines().
+        result = self._lint_lines(filename, lines)
 
         if self.cli_args.fix:
             self._fix_file(filename)
 
+        return result
+
     def lint_lines(self, identifier, lines):
+        lines = list(lines)
+        key = (identifier, tuple(lines))
+
+        try:
+            fixed_lines, messages = self._lint_results[key]
+        except KeyError:
+            self._lint_lines(identifier, lines)
+            self._cache_lint_result(key)
+            return (self._parameters.lines, self._reporter)
+
+        # The content was linted before, so its messages are reported again
+        # without running the rules.
         self._reporter.start_file(identifier)
-        self._parameters.start_new_file(identifier, lines)
+        self._parameters.start_new_file(identifier, list(fixed_lines))
+        for message in messages:
+            self._reporter.report(message)
+        self._reporter.finalize_file()
 
-        for _ in self._parameters:
-            self._run_checkers(RULES["common"])
+        return (self._parameters.lines, self._reporter)
 
-            if self._parameters.is_code:
-                self._run_checkers(RULES["code"])
+    def _cache_lint_result(self, key):
+        if len(self._lint_results) >= LINT_RESULTS_CACHE_SIZE:
+            del self._lint_results[next(iter(self._lint_results))]
 
-            if self._parameters.is_comment:
-                self._run_checkers(RULES["comment"])
+        self._lint_results[key] = (tuple(self._parameters.lines),
+                                   tuple(self._reporter.messages))
+
+    def _lint_lines(self, identifier, lines):
+        self._reporter.start_file(identifier)
+        self._parameters.start_new_file(identifier, lines)
+
+        for line_number in range(self._parameters.total_lines):
+            self._parameters.start_new_line(line_number)
+            self._run_checkers(self._rules[
+                self._parameters.is_code, self._parameters.is_comment])
 
         self._reporter.finalize_file()
 
         return (self._parameters.lines, self._reporter)
 
+    def _lint_targets_in_parallel(self, target_files):
+        # All targets share one pool, but the results are still reported in
+        # the order of the targets and summarized after each of them.
+        with self._create_worker_pool() as executor:
+            results = executor.map(
+                _lint_file_worker, chain.from_iterable(target_files),
+                chunksize=self._get_chunksize(sum(map(len, target_files))))
+            for filenames in target_files:
+                self._report_worker_results(islice(results, len(filenames)))
+                self._reporter.finalize()
+
+    def _lint_files_in_parallel(self, filenames):
+        with self._create_worker_pool() as executor:
+            self._report_worker_results(executor.map(
+                _lint_file_worker, filenames,
+                chunksize=self._get_chunksize(len(filenames))))
+
+    def _get_chunksize(self, total_files):
+        # Sending the files in chunks saves inter-process round trips, while
+        # several chunks per process still balance files of different sizes.
+        return max(1, total_files // (self.jobs * CHUNKS_PER_PROCESS))
+
+    def _create_worker_pool(self):
+        worker_args = copy(self.cli_args)
+        worker_args.generate_config = False
+        worker_config = _create_worker_configuration(self.config)
+
+        return ProcessPoolExecutor(max_workers=self.jobs,
+                                   initializer=_init_worker,
+                                   initargs=(worker_args, worker_config))
+
+    def _report_worker_results(self, results):
+        for filename, messages in results:
+            self._reporter.start_file(filename)
+            for message in messages:
+                self._reporter.report(message)
+            self._reporter.finalize_file()
+
     def _run_checkers(self, rules):
-        for rule in rules:
-            self._check_result(self._run_check(rule), rule)
+        for lint, fix in rules:
+            # A fix always repairs the whole line, so it is applied once even
+            # if the rule reported several issues in it.
+            if self._report_results(lint(self._parameters)) and fix:
+                self._fix_line(fix)
 
     def _fix_file(self, filename):
         with open(filename, "w") as content:
-            content.writelines(self._parameters.lines)
+            content.write("".join(self._parameters.lines))
 
-    def _check_result(self, results, checker):
+    def _report_results(self, results):
         if results is None:
-            return
+            return False
 
+        reported = False
         for result in results:
-            _, _, code, _ = result
-            if code in self.config.DISABLE:
-                continue
-
             self._reporter.report(self._build_message(result))
+            reported = True
 
-            if self.cli_args.fix:
-                self._fix_line(checker)
+        return reported
 
     def _build_message(self, result):
         category, column, code, message = result
         return Message(
             category, code, self._parameters.line_number, column, message)
 
-    def _fix_line(self, checker):
-        fixed_line = self._run_fix(checker)
+    def _fix_line(self, fix):
+        fixed_line = fix(self._parameters)
         if fixed_line is not None:
             self._parameters.line = fixed_line
 
-    def _run_check(self, checker):
-        return self._run_method(checker.lint)
 
-    def _run_fix(self, checker):
-        return self._run_method(checker.fix)
+def _find_target_files(target, extensions):
+    if os.path.isdir(target):
+        return list(_find_files(target, extensions))
+
+    return [target]
+
+
+def _remove_duplicate_files(target_files):
+    # Overlapping targets must also not pass the same file to two workers,
+    # which would then fix it at the same time.
+    found_files = set()
+    unique_target_files = []
+
+    for filenames in target_files:
+        unique_filenames = []
+        for filename in filenames:
+            path = os.path.realpath(filename)
+            if path not in found_files:
+                found_files.add(path)
+                unique_filenames.append(filename)
+        unique_target_files.append(unique_filenames)
+
+    return unique_target_files
+
+
+def _find_files(dirname, extensions):
+    # Like os.walk(), directories which cannot be read are skipped
+    try:
+        with os.scandir(dirname) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    # Like os.walk(), the files of a directory come before its subdirectories
+    subdirectories = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirectories.append(entry.path)
+        elif entry.name.endswith(extensions) and entry.is_file():
+            yield entry.path
+
+    for subdirectory in subdirectories:
+        yield from _find_files(subdirectory, extensions)
+
+
+READ_AHEAD = 4
+
+LINT_RESULTS_CACHE_SIZE = 32
+
+RESULT_CACHE_SIZE = 4096
+
+# Starting worker processes costs more than linting a few files serially
+PARALLEL_MIN_FILES = 8
+
+CHUNKS_PER_PROCESS = 4
 
-    def _run_method(self, method):
-        parameters = []
-        for parameter in get_parameters(method):
-            if parameter == "self":
-                continue
-            parameters.append(getattr(self._parameters, parameter))
 
-        return method(*parameters)
+def _read_lines(filename):
+    with open(filename) as content:
+        return content.readlines()
+
+
+def _read_files_ahead(filenames):
+    """
+    Yields the lines of each file while a background thread already reads
+    up to READ_AHEAD of the following files.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = deque()
+        for filename in filenames:
+            pending.append((filename, executor.submit(_read_lines, filename)))
+            if len(pending) > READ_AHEAD:
+                filename, future = pending.popleft()
+                yield filename, future.result()
+
+        while pending:
+            filename, future = pending.popleft()
+            yield filename, future.result()
+
+
+def _create_rule_sequences(common_rules, code_rules, comment_rules):
+    """
+    Creates the rules to run for every combination of is_code and is_comment
+    so that each line needs a single lookup to know which rules apply.
+    """
+    return {
+        (is_code, is_comment): (common_rules +
+                                (code_rules if is_code else ()) +
+                                (comment_rules if is_comment else ()))
+        for is_code in (False, True)
+        for is_comment in (False, True)
+    }
+
+
+def _is_rule_disabled(rule, disabled):
+    return bool(rule.CODES) and disabled.issuperset(rule.CODES)
+
+
+def _bind_rule(rule, disabled, fix):
+    lint = _bind_method(rule.lint)
+
+    # Rules without CODES might report any of the disabled issues
+    if not disabled.isdisjoint(rule.CODES or disabled):
+        lint = _filter_results(lint, disabled)
+
+    if rule.CACHEABLE:
+        lint = _cache_results(lint, {})
+
+    return (lint, _bind_method(rule.fix) if fix else None)
+
+
+def _filter_results(lint, disabled):
+    def lint_filtered(parameters):
+        return tuple(result for result in lint(parameters) or ()
+                     if result[2] not in disabled)
+
+    return lint_filtered
+
+
+def _cache_results(lint, cache):
+    def lint_cached(parameters):
+        try:
+            return cache[parameters.line]
+        except KeyError:
+            # The results only depend on the line, so they stay valid for
+            # all files, the cache is only emptied to limit its size.
+            if len(cache) >= RESULT_CACHE_SIZE:
+                cache.clear()
+
+            results = tuple(lint(parameters) or ())
+            cache[parameters.line] = results
+            return results
+
+    return lint_cached
+
+
+def _bind_method(method):
+    names = [name for name in get_parameters(method) if name != "self"]
+
+    if not names:
+        return lambda _: method()
+
+    get_arguments = attrgetter(*names)
+
+    if len(names) == 1:
+        return lambda parameters: method(get_arguments(parameters))
+
+    return lambda parameters: method(*get_arguments(parameters))
+
+
+_WORKER_LINTER = None
+
+
+def _create_worker_configuration(config):
+    worker_config = SimpleNamespace(**{
+        attr: value for attr, value in vars(config).items() if attr.isupper()})
+    worker_config.REPORTER = MemoryReporter
+    return worker_config
+
+
+def _init_worker(cli_args, config):
+    global _WORKER_LINTER
+    _WORKER_LINTER = Linter(cli_args, config)
+
+
+def _lint_file_worker(filename):
+    _, reporter = _WORKER_LINTER.lint_file(filename)
+    return filename, reporter.messages
 
 
 def _create_arg_parser():
@@ -142,6 +393,13 @@ def _create_arg_parser():
                     f"the following arguments are required: {self.dest}")
 
 
+    def job_count(value):
+        jobs = int(value)
+        if jobs < 0:
+            raise ArgumentTypeError(f"must not be negative: {value}")
+        return jobs
+
+
     parser = ArgumentParser(description=__doc__)
     parser.add_argument("--version", action="version",
                         version=f"%(prog)s {krllint.__version__}")
@@ -151,6 +409,9 @@ def _create_arg_parser():
                         help="Generates configuration file at current location")
     parser.add_argument("--fix", action="store_true",
                         help="automatically fix the given inputs")
+    parser.add_argument("-j", "--jobs", type=job_count, default=1,
+                        help="number of processes used to lint the files "
+                             "(0 uses one process per CPU)")
     parser.add_argument("target", action=TargetAction, nargs="*",
                         help="file or folder to lint")
 
@@ -3,27 +3,25 @@
 class Parameters:
     def __init__(self, config):
         self._lines = []
-        self._next = 0
         self._filename = None
+        self.line_number = -1
+        self.code_line = None
+        self.comment_line = None
+        self.is_code = False
+        self.is_comment = False
 
         for attr, value in config.__dict__.items():
             if not attr.startswith("_"):
                 setattr(self, attr.lower(), value)
 
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._next == self.total_lines:
-            raise StopIteration
-
-        self._next += 1
-        return self.lines[self.line_number]
-
     def start_new_file(self, filename, lines):
-        self._lines = lines.copy()
-        self._next = 0
+        self._lines = lines
         self._filename = filename
+        self.line_number = -1
+
+    def start_new_line(self, line_number):
+        self.line_number = line_number
+        self._analyse_line(self._lines[line_number])
 
     @property
     def filename(self):
@@ -33,10 +31,6 @@ class Parameters:
     def lines(self):
         return self._lines
 
-    @property
-    def line_number(self):
-        return self._next - 1
-
     @property
     def total_lines(self):
         return len(self._lines)
@@ -50,26 +44,15 @@ class Parameters:
     @line.setter
     def line(self, value):
         self.lines[self.line_number] = value
+        self._analyse_line(value)
 
-    @property
-    def code_line(self):
-        return self.line.split(";", 1)[0]
+    def _analyse_line(self, line):
+        self.code_line, separator, self.comment_line = line.partition(";")
+        first_char = line.lstrip()[:1]
 
-    @property
-    def comment_line(self):
-        if len(self.line.split(";")) == 2:
-            return self.line.split(";", 1)[1]
-
-        if (self.line.split("&")) == 2:
-            return self.line.split("&", 1)[1]
-
-        return ""
+        # Header lines like "&ACCESS RVP" are treated as comments
+        if not separator and first_char == "&":
+            self.comment_line = line.partition("&")[2]
 
-    @property
-    def is_code(self):
-        return (not self.line.lstrip().startswith(";") and
-                not self.line.lstrip().startswith("&"))
-
-    @property
-    def is_comment(self):
-        return any(char in self.line for char in [";", "&"])
+        self.is_code = first_char not in ("", ";", "&")
+        self.is_comment = bool(separator) or first_char == "&"
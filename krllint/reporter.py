@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import sys
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from enum import Enum
@@ -22,6 +23,10 @@ class BaseReporter(ABC):
     def __init__(self):
         self.filename = None
         self.messages = []
+        self._highest_line_number = 0
+        self._highest_column = 0
+        self._max_line_number = 0
+        self._max_column = 0
         self.found_issues = {
             Category.CONVENTION: 0,
             Category.REFACTOR: 0,
@@ -29,19 +34,28 @@ class BaseReporter(ABC):
             Category.ERROR: 0,
             Category.FATAL: 0
         }
+        self._handlers = {
+            category: getattr(self, "handle_" + category.name.lower())
+            for category in self.found_issues
+        }
 
     def start_file(self, filename):
         self.filename = filename
         self.messages = []
+        self._highest_line_number = 0
+        self._highest_column = 0
 
     def finalize_file(self):
         if self.messages:
+            # The widths are needed for every message, so they are computed
+            # once per file from the maxima tracked in report().
+            self._max_line_number = len(str(self._highest_line_number))
+            self._max_column = len(str(self._highest_column))
             self.handle_new_file()
 
+            handlers = self._handlers
             for message in self.messages:
-                handle = getattr(
-                    self, "handle_" + message.category.name.lower())
-                handle(message)
+                handlers[message.category](message)
 
         self.filename = None
 
@@ -53,6 +67,11 @@ class BaseReporter(ABC):
         self.found_issues[message.category] += 1
         self.messages.append(message)
 
+        if message.line_number > self._highest_line_number:
+            self._highest_line_number = message.line_number
+        if message.column > self._highest_column:
+            self._highest_column = message.column
+
     @abstractmethod
     def handle_new_file(self):
         pass
@@ -79,15 +98,11 @@ class BaseReporter(ABC):
 
     @property
     def max_line_number(self):
-        return len(str(max(
-            self.messages,
-            key=lambda message: message.line_number).line_number))
+        return self._max_line_number
 
     @property
     def max_column(self):
-        return len(str(max(
-            self.messages,
-            key=lambda message: message.column).column))
+        return self._max_column
 
 
 class MemoryReporter(BaseReporter):
@@ -114,17 +129,30 @@ class MemoryReporter(BaseReporter):
 
 
 class TextReporter(BaseReporter):
+    def __init__(self):
+        super().__init__()
+        self._output = []
+        self._message_format = None
+
     def handle_new_file(self):
-        print(f"***** {self.filename}")
+        self._write(f"***** {self.filename}")
+
+    def finalize_file(self):
+        super().finalize_file()
+        self._message_format = None
+        self._flush()
 
     def finalize(self):
-        print(20 * "-")
-        print("Result:")
-        print(f"{self.found_issues[Category.CONVENTION]} violated conventions")
-        print(f"{self.found_issues[Category.REFACTOR]} possible refactorings")
-        print(f"{self.found_issues[Category.WARNING]} found warnings")
-        print(f"{self.found_issues[Category.ERROR]} found errors")
-        print(f"{self.found_issues[Category.FATAL]} fatal errors")
+        self._write(20 * "-")
+        self._write("Result:")
+        self._write(
+            f"{self.found_issues[Category.CONVENTION]} violated conventions")
+        self._write(
+            f"{self.found_issues[Category.REFACTOR]} possible refactorings")
+        self._write(f"{self.found_issues[Category.WARNING]} found warnings")
+        self._write(f"{self.found_issues[Category.ERROR]} found errors")
+        self._write(f"{self.found_issues[Category.FATAL]} fatal errors")
+        self._flush()
 
     def handle_convention(self, message):
         self.handle_message(message)
@@ -142,10 +170,27 @@ class TextReporter(BaseReporter):
         self.handle_message(message)
 
     def handle_message(self, message):
-        print(
-            f"{message.line_number + 1:>{self.max_line_number}}:"
-            f"{message.column + 1:<{self.max_column}}: "
-            f"{message.message} [{message.code}]")
+        self._write_message(message, message.message)
+
+    def _write_message(self, message, text):
+        # The widths are the same for all messages of a file, so the format
+        # is only built for the first message of each file.
+        if self._message_format is None:
+            self._message_format = (f"{{:>{self.max_line_number}}}:"
+                                    f"{{:<{self.max_column}}}: {{}} [{{}}]")
+
+        self._write(self._message_format.format(
+            message.line_number + 1, message.column + 1, text, message.code))
+
+    def _write(self, text):
+        self._output.append(text + "\n")
+
+    def _flush(self):
+        sys.stdout.write("".join(self._output))
+        self._output.clear()
+
+
+_ANSI_CODES = {}
 
 
 class ColorizedTextReporter(TextReporter):
@@ -180,7 +225,7 @@ class ColorizedTextReporter(TextReporter):
         init()
 
     def handle_new_file(self):
-        print(self._colorize(f"***** {self.filename}", self.SEPERATOR))
+        self._write(self._colorize(f"***** {self.filename}", self.SEPERATOR))
 
     def handle_convention(self, message):
         self.handle_message(message, self.CONVENTION)
@@ -198,14 +243,21 @@ class ColorizedTextReporter(TextReporter):
         self.handle_message(message, self.FATAL)
 
     def handle_message(self, message, style):
-        print(
-            f"{message.line_number + 1:>{self.max_line_number}}:"
-            f"{message.column + 1:<{self.max_column}}: "
-            f"{self._colorize(message.message, style)} [{message.code}]")
+        self._write_message(message, self._colorize(message.message, style))
 
     @classmethod
     def _colorize(cls, message, style):
-        return cls._get_ansi_code(*style) + message + cls.RESET
+        # Only a few styles are used, so their escape codes are built once
+        # instead of for every message.
+        foreground, styles = style
+        key = (cls, foreground, tuple(styles or ()))
+
+        try:
+            ansi_code = _ANSI_CODES[key]
+        except KeyError:
+            ansi_code = _ANSI_CODES[key] = cls._get_ansi_code(*style)
+
+        return ansi_code + message + cls.RESET
 
     @classmethod
     def _get_ansi_code(cls, foreground=None, styles=None):
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import re
-from abc import ABC, abstractproperty
+from functools import lru_cache
 
 from .reporter import Category
 from .api import BaseRule
@@ -30,8 +30,7 @@ OPERATORS = [
 ]
 
 INDENT_IDENTIFIERS = [
-    "IF", "ELSE", r"(?<!WAIT\s)FOR", "LOOP", "REPEAT", "SWITCH", "CASE",
-    "DEFAULT", "WHILE"
+    "IF", "ELSE", "FOR", "LOOP", "REPEAT", "SWITCH", "CASE", "DEFAULT", "WHILE"
 ]
 
 UNINDENT_IDENTIFIERS = [
@@ -39,12 +38,40 @@ UNINDENT_IDENTIFIERS = [
     "ENDSWITCH", "ENDWHILE"
 ]
 
+KEYWORD_SET = frozenset(KEYWORDS)
+
+BUILT_IN_TYPE_SET = frozenset(BUILT_IN_TYPES)
+
+INDENT_SET = frozenset(INDENT_IDENTIFIERS)
+
+UNINDENT_SET = frozenset(UNINDENT_IDENTIFIERS)
+
+WORD_PATTERN = re.compile(r"(?<!#)\b\w+")
+
+
+@lru_cache(maxsize=1)
+def _find_words(code_line):
+    if not code_line or code_line.isspace():
+        return ()
+
+    return tuple((match.start(), match.group(), match.group().upper())
+                 for match in WORD_PATTERN.finditer(code_line))
+
+
+def _is_wait_for(code_line, column):
+    # "WAIT FOR" waits for a condition and does not start a FOR loop
+    return (column >= 5 and
+            code_line[column - 5:column - 1].upper() == "WAIT" and
+            code_line[column - 1].isspace())
+
 
 class TrailingWhitespace(BaseRule):
+    CACHEABLE = True
+    CODES = ("trailing-whitespace",)
+
     def lint(self, line):
-        line = line.rstrip("\r\n")
         stripped_line = line.rstrip()
-        if line != stripped_line:
+        if line[len(stripped_line):].strip("\r\n"):
             yield (Category.CONVENTION,
                    len(stripped_line),
                    "trailing-whitespace",
@@ -55,35 +82,28 @@ class TrailingWhitespace(BaseRule):
 
 
 class MixedIndentation(BaseRule):
-    def lint(self, line, indent_char):
-        invalid_character = [" ", "\t"]
-        invalid_character.remove(indent_char)
+    CACHEABLE = True
+    CODES = ("mixed-indentation",)
+    INVALID_CHARACTERS = {" ": "\t", "\t": " "}
 
-        if any(map(lambda char: char in line, invalid_character)):
+    def lint(self, line, indent_char):
+        if self.INVALID_CHARACTERS[indent_char] in line:
             yield (Category.WARNING,
                    0,
                    "mixed-indentation",
                    "line contains tab(s)")
 
     def fix(self, line, indent_char, indent_size):
-        invalid_character = [" ", "\t"]
-        invalid_character.remove(indent_char)
-        return line.replace(invalid_character[0], indent_char * indent_size)
+        return line.replace(self.INVALID_CHARACTERS[indent_char],
+                            indent_char * indent_size)
 
 
 class IndentationChecker(BaseRule):
-    INDENT_PATTERN = re.compile(
-        r"(?<!#)(\b(?:" + "|".join(INDENT_IDENTIFIERS) + r")\b)",
-        re.IGNORECASE)
-
-    UNINDENT_PATTERN = re.compile(
-        r"(?<!#)(\b(?:" + "|".join(UNINDENT_IDENTIFIERS) + r")\b)",
-        re.IGNORECASE)
+    CODES = ("bad-indentation", "bad-indented-inline-form")
 
-    ILF_PATTERN = re.compile(
-        r";FOLD.*;%\{.*\}",
-        re.IGNORECASE
-    )
+    # The patterns are matched against upper cased lines, which is cheaper
+    # than matching case insensitively.
+    ILF_PATTERN = re.compile(r";FOLD.*;%\{.*\}")
 
     def __init__(self):
         self._filename = None
@@ -147,13 +167,15 @@ class IndentationChecker(BaseRule):
         self._indent_next_line = False
 
     def _analyse_indentation(self, code_line):
+        indent, unindent = self._find_indentation_changes(code_line)
+
         if self._indent_next_line:
             self._increase_indent_level()
 
-        if self._is_unindentation_needed(code_line):
+        if unindent:
             self._decrease_indent_level()
 
-        if self._is_indentation_needed(code_line):
+        if indent:
             self._indent_next_line = True
 
     def _analyse_inline_form(self, code_line):
@@ -164,16 +186,25 @@ class IndentationChecker(BaseRule):
             self._decrease_fold_level()
 
     @staticmethod
-    def _is_indentation_needed(code_line):
-        return not IndentationChecker.INDENT_PATTERN.search(code_line) is None
+    def _find_indentation_changes(code_line):
+        indent = unindent = False
 
-    @staticmethod
-    def _is_unindentation_needed(code_line):
-        return not IndentationChecker.UNINDENT_PATTERN.search(code_line) is None
+        for column, _, word in _find_words(code_line):
+            if word in INDENT_SET and not (
+                    word == "FOR" and _is_wait_for(code_line, column)):
+                indent = True
+            if word in UNINDENT_SET:
+                unindent = True
+
+        return indent, unindent
 
     @staticmethod
     def _is_inline_form(code_line):
-        return not IndentationChecker.ILF_PATTERN.search(code_line) is None
+        # Every inline form contains "%{", checking for it first avoids
+        # running the pattern on almost all lines.
+        return ("%{" in code_line and
+                IndentationChecker.ILF_PATTERN.search(
+                    code_line.upper()) is not None)
 
     @staticmethod
     def _is_fold_start(code_line):
@@ -203,6 +234,8 @@ class IndentationChecker(BaseRule):
 
 
 class ExtraneousWhitespace(BaseRule):
+    CACHEABLE = True
+    CODES = ("superfluous-whitespace",)
     WHITESPACE_PATTERN = re.compile(r"(?<=\S)\s{2,}")
 
     def lint(self, code_line):
@@ -213,64 +246,55 @@ class ExtraneousWhitespace(BaseRule):
                    "superfluous whitespace")
 
     def fix(self, code_line, comment_line):
-        return (self.WHITESPACE_PATTERN.sub(lambda _: " ", code_line) +
+        return (self.WHITESPACE_PATTERN.sub(" ", code_line) +
                 ((";" + comment_line) if comment_line else ""))
 
 
-class BaseMixedCaseChecker(ABC):
-    @abstractproperty
-    def pattern(self):
-        raise NotImplementedError
+class BaseMixedCaseChecker:
+    CACHEABLE = True
+    WORDS = frozenset()
+    CODE = None
+    MESSAGE = None
 
     def lint(self, code_line):
-        for match in self.pattern.finditer(code_line):
-            if not str(match.group(1)).isupper():
-                yield match.start()
+        for column, word, upper_word in _find_words(code_line):
+            if upper_word in self.WORDS and word != upper_word:
+                yield (Category.WARNING, column, self.CODE, self.MESSAGE)
 
     def fix(self, code_line, comment_line):
-        return (self.pattern.sub(self._fix_match, code_line) +
+        return (WORD_PATTERN.sub(self._fix_match, code_line) +
                 ((";" + comment_line) if comment_line else ""))
 
-    @staticmethod
-    def _fix_match(match):
-        target = str(match.group(1))
-        return target if target.isupper() else target.upper()
+    def _fix_match(self, match):
+        target = match.group()
+        upper_target = target.upper()
+        return upper_target if upper_target in self.WORDS else target
 
 
 class LowerOrMixedCaseKeyword(BaseMixedCaseChecker, BaseRule):
-    @property
-    def pattern(self):
-        return re.compile(r"(?<!#)(\b(?:" + "|".join(KEYWORDS) + r")\b)",
-                          re.IGNORECASE)
-
-    def lint(self, code_line):
-        for column in super().lint(code_line):
-            yield (Category.WARNING,
-                   column,
-                   "wrong-case-keyword",
-                   "lower or mixed case keyword")
+    WORDS = KEYWORD_SET
+    CODE = "wrong-case-keyword"
+    CODES = (CODE,)
+    MESSAGE = "lower or mixed case keyword"
 
 
 class LowerOrMixedCaseBuiltInType(BaseMixedCaseChecker, BaseRule):
-    @property
-    def pattern(self):
-        return re.compile(r"(?<!#)(\b(?:" + "|".join(BUILT_IN_TYPES) + r")\b)",
-                          re.IGNORECASE)
-
-    def lint(self, code_line):
-        for column in super().lint(code_line):
-            yield  (Category.WARNING,
-                    column,
-                    "wrong-case-type",
-                    "lower or mixed case built-in type")
+    WORDS = BUILT_IN_TYPE_SET
+    CODE = "wrong-case-type"
+    CODES = (CODE,)
+    MESSAGE = "lower or mixed case built-in type"
 
 
 class OpenTask(BaseRule):
+    CACHEABLE = True
+    CODES = ("open-task",)
+
+    def __init__(self):
+        self._identifiers = None
+        self._pattern = None
+
     def lint(self, comment_line, open_task_identifiers):
-        pattern = re.compile(
-            r"\b(" +
-            "|".join(open_task_identifiers) +
-            r")\b\s?(.*)")
+        pattern = self._get_pattern(open_task_identifiers)
 
         for match in pattern.finditer(comment_line):
             yield (Category.WARNING,
@@ -280,3 +304,14 @@ class OpenTask(BaseRule):
 
     def fix(self):
         pass
+
+    def _get_pattern(self, identifiers):
+        # The identifiers come from the configuration, so the pattern is only
+        # compiled again if they differ from the previous call.
+        key = tuple(identifiers)
+        if key != self._identifiers:
+            self._identifiers = key
+            self._pattern = re.compile(
+                r"\b(" + "|".join(identifiers) + r")\b\s?(.*)")
+
+        return self._pattern
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import inspect
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_parameters(method):
-    return [parameter.name
-            for parameter in inspect.signature(method).parameters.values()
-            if parameter.kind == parameter.POSITIONAL_OR_KEYWORD]
+    return tuple(
+        parameter.name
+        for parameter in inspect.signature(method).parameters.values()
+        if parameter.kind == parameter.POSITIONAL_OR_KEYWORD)
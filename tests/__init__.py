@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+from types import SimpleNamespace
+
+from krllint import config
+from krllint.reporter import MemoryReporter
+
+
+def create_config(**settings):
+    """
+    Creates a copy of the default configuration with the given settings, so
+    tests do not need to reload and modify the config module.
+    """
+    defaults = {attr: value
+                for attr, value in vars(config).items() if attr.isupper()}
+    defaults["REPORTER"] = MemoryReporter
+    defaults.update(settings)
+    return SimpleNamespace(**defaults)
@@ -1,21 +1,21 @@
 # -*- coding: utf-8 -*-
 
 from unittest import TestCase
-from importlib import reload
 
-from krllint import config
-from krllint.reporter import Category, MemoryReporter
+from krllint.reporter import Category
 from krllint.linter import _create_arg_parser, Linter
 
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
 class ExtraneousWhiteSpaceTestCase(TestCase):
-    TEST_INPUT = ["foo  bar\n"]
-    FIXED_INPUT = ["foo bar\n"]
+    TEST_INPUT = ("foo  bar\n",)
+    FIXED_INPUT = ("foo bar\n",)
 
     def test_rule_without_fix(self):
-        cli_args = _create_arg_parser().parse_args(["test_rule_without_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["test_rule_without_fix"])
+        linter = Linter(cli_args, create_config())
         lines, reporter = linter.lint_lines("test_rule_without_fix", self.TEST_INPUT)
 
         self.assertEqual(reporter.found_issues[Category.CONVENTION], 1)
@@ -24,7 +24,7 @@ class ExtraneousWhiteSpaceTestCase(TestCase):
         self.assertEqual(reporter.found_issues[Category.ERROR], 0)
         self.assertEqual(reporter.found_issues[Category.FATAL], 0)
 
-        self.assertEqual(lines, self.TEST_INPUT)
+        self.assertEqual(lines, list(self.TEST_INPUT))
 
         self.assertEqual(reporter.messages[0].line_number, 0)
         self.assertEqual(reporter.messages[0].column, 3)
@@ -32,10 +32,15 @@ class ExtraneousWhiteSpaceTestCase(TestCase):
         self.assertEqual(reporter.messages[0].code, "superfluous-whitespace")
 
     def test_rule_with_fix(self):
-        cli_args = _create_arg_parser().parse_args(["--fix", "test_rule_with_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_fix"])
+        linter = Linter(cli_args, create_config())
         lines, _ = linter.lint_lines("test_rule_with_fix", self.TEST_INPUT)
 
-        self.assertEqual(lines, self.FIXED_INPUT)
+        self.assertEqual(lines, list(self.FIXED_INPUT))
+
+    def test_rule_with_fix_and_comment(self):
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_fix_and_comment"])
+        linter = Linter(cli_args, create_config())
+        lines, _ = linter.lint_lines("test_rule_with_fix_and_comment", ["foo  bar ;a; b\n"])
+
+        self.assertEqual(lines, ["foo bar ;a; b\n"])
@@ -1,36 +1,36 @@
 # -*- coding: utf-8 -*-
 
 from unittest import TestCase
-from importlib import reload
 
-from krllint import config
-from krllint.reporter import Category, MemoryReporter
+from krllint.reporter import Category
 from krllint.linter import _create_arg_parser, Linter
 
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
 class IndentationCheckerTestCase(TestCase):
-    TEST_INPUT = [
+    TEST_INPUT = (
         "IF foo THEN\n",
         "      bar\n",
         "ENDIF\n",
         "\n",
         "   ;FOLD PTP;%{PE}\n",
         "   ;ENDFOLD\n"
-    ]
+    )
 
-    FIXED_INPUT = [
+    FIXED_INPUT = (
         "IF foo THEN\n",
         "   bar\n",
         "ENDIF\n",
         "\n",
         ";FOLD PTP;%{PE}\n",
         ";ENDFOLD\n"
-    ]
+    )
 
     def test_rule_without_fix(self):
-        cli_args = _create_arg_parser().parse_args(["test_rule_without_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["test_rule_without_fix"])
+        linter = Linter(cli_args, create_config())
         lines, reporter = linter.lint_lines("test_rule_without_fix", self.TEST_INPUT)
 
         self.assertEqual(reporter.found_issues[Category.CONVENTION], 0)
@@ -39,7 +39,7 @@ class IndentationCheckerTestCase(TestCase):
         self.assertEqual(reporter.found_issues[Category.ERROR], 0)
         self.assertEqual(reporter.found_issues[Category.FATAL], 0)
 
-        self.assertEqual(lines, self.TEST_INPUT)
+        self.assertEqual(lines, list(self.TEST_INPUT))
 
         self.assertEqual(reporter.messages[0].line_number, 1)
         self.assertEqual(reporter.messages[0].column, 6)
@@ -57,10 +57,15 @@ class IndentationCheckerTestCase(TestCase):
         self.assertEqual(reporter.messages[2].code, "bad-indented-inline-form")
 
     def test_rule_with_fix(self):
-        cli_args = _create_arg_parser().parse_args(["--fix", "test_rule_with_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_fix"])
+        linter = Linter(cli_args, create_config())
         lines, _ = linter.lint_lines("test_rule_with_fix", self.TEST_INPUT)
 
-        self.assertEqual(lines, self.FIXED_INPUT)
+        self.assertEqual(lines, list(self.FIXED_INPUT))
+
+    def test_rule_with_wait_for(self):
+        cli_args = _PARSER.parse_args(["test_rule_with_wait_for"])
+        linter = Linter(cli_args, create_config())
+        _, reporter = linter.lint_lines("test_rule_with_wait_for", ["WAIT FOR foo\n", "bar\n"])
+
+        self.assertEqual(reporter.found_issues[Category.WARNING], 0)
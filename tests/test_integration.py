@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import os
+from unittest import TestCase
+
+from krllint.reporter import Category
+from krllint.linter import _create_arg_parser, Linter
+
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
+FILES_DIRECTORY = os.path.join(os.path.dirname(__file__), "files")
+
+def _read_lines(name):
+    with open(os.path.join(FILES_DIRECTORY, name)) as content:
+        return tuple(content.readlines())
+
+class IntegrationTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dirty_lines = _read_lines("dirty.src")
+        cls.clean_lines = _read_lines("clean.src")
+
+    def test_dirty_file(self):
+        cli_args = _PARSER.parse_args(["dirty.src"])
+        linter = Linter(cli_args, create_config())
+        lines, reporter = linter.lint_lines("dirty.src", self.dirty_lines)
+
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 2)
+        self.assertEqual(reporter.found_issues[Category.REFACTOR], 0)
+        self.assertEqual(reporter.found_issues[Category.WARNING], 24)
+        self.assertEqual(reporter.found_issues[Category.ERROR], 0)
+        self.assertEqual(reporter.found_issues[Category.FATAL], 0)
+
+        self.assertEqual(lines, list(self.dirty_lines))
+
+    def test_dirty_file_with_fix(self):
+        cli_args = _PARSER.parse_args(["--fix", "dirty.src"])
+        linter = Linter(cli_args, create_config())
+        lines, _ = linter.lint_lines("dirty.src", self.dirty_lines)
+
+        self.assertEqual(lines, list(self.clean_lines))
+
+    def test_clean_file(self):
+        cli_args = _PARSER.parse_args(["clean.src"])
+        linter = Linter(cli_args, create_config())
+        _, reporter = linter.lint_lines("clean.src", self.clean_lines)
+
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 0)
+        self.assertEqual(reporter.found_issues[Category.WARNING], 1)
+        self.assertEqual(reporter.messages[0].code, "open-task")
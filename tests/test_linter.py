@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+import os
+from argparse import Namespace
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import TestCase, mock
+from tempfile import TemporaryDirectory
+
+from krllint.api import RULES
+from krllint.reporter import Category
+from krllint.rules import TrailingWhitespace
+from krllint.linter import _create_arg_parser, _find_files, Linter
+
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
+def _scandir_denying(denied_dirname, scandir=os.scandir):
+    def scandir_denying(dirname):
+        if dirname == denied_dirname:
+            raise PermissionError(f"Permission denied: '{dirname}'")
+        return scandir(dirname)
+
+    return scandir_denying
+
+class LinterTestCase(TestCase):
+    TEST_INPUT = ("if foo then\n", "bar   \n", "endif\n")
+    FIXED_INPUT = ("IF foo THEN\n", "   bar\n", "ENDIF\n")
+
+    def _lint_directory(self, arguments):
+        with TemporaryDirectory() as dirname:
+            for name in ("a.src", "b.dat", os.path.join("sub", "c.sub")):
+                filename = os.path.join(dirname, name)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, "w") as content:
+                    content.writelines(self.TEST_INPUT)
+
+            with open(os.path.join(dirname, "ignored.txt"), "w") as content:
+                content.writelines(self.TEST_INPUT)
+
+            cli_args = _PARSER.parse_args(arguments + [dirname])
+            linter = Linter(cli_args, create_config())
+            linter.lint_directory(dirname)
+
+            results = []
+            for name in ("a.src", "b.dat", os.path.join("sub", "c.sub"),
+                         "ignored.txt"):
+                with open(os.path.join(dirname, name)) as content:
+                    results.append(content.readlines())
+
+            return linter._reporter, results
+
+    def test_find_files(self):
+        with TemporaryDirectory() as dirname:
+            for name in ("a.src", os.path.join("sub", "b.dat")):
+                filename = os.path.join(dirname, name)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, "w") as content:
+                    content.writelines(self.TEST_INPUT)
+
+            # A link to a directory is neither followed nor linted as a file
+            os.symlink(os.path.join(dirname, "sub"),
+                       os.path.join(dirname, "link.src"))
+
+            with mock.patch("os.scandir", side_effect=_scandir_denying(
+                    os.path.join(dirname, "sub"))):
+                filenames = list(_find_files(dirname, (".src", ".dat")))
+
+        self.assertEqual(filenames, [os.path.join(dirname, "a.src")])
+
+    def test_find_files_order(self):
+        with TemporaryDirectory() as dirname:
+            names = ("b.src", os.path.join("a", "d.src"),
+                     os.path.join("a", "c", "e.src"), os.path.join("c", "f.src"))
+            for name in names:
+                filename = os.path.join(dirname, name)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                open(filename, "w").close()
+
+            filenames = list(_find_files(dirname, (".src",)))
+
+        self.assertEqual(
+            filenames, [os.path.join(dirname, name) for name in names])
+
+    def test_lint_directory(self):
+        reporter, results = self._lint_directory([])
+
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 3)
+        self.assertEqual(reporter.found_issues[Category.WARNING], 12)
+        self.assertEqual(results, 4 * [list(self.TEST_INPUT)])
+
+    @mock.patch("krllint.linter.PARALLEL_MIN_FILES", 1)
+    def test_lint_directory_with_jobs(self):
+        reporter, results = self._lint_directory(["--jobs", "2"])
+
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 3)
+        self.assertEqual(reporter.found_issues[Category.WARNING], 12)
+        self.assertEqual(results, 4 * [list(self.TEST_INPUT)])
+
+    @mock.patch("krllint.linter.PARALLEL_MIN_FILES", 1)
+    def test_lint_directory_with_jobs_and_fix(self):
+        _, results = self._lint_directory(["--fix", "--jobs", "2"])
+
+        self.assertEqual(
+            results, 3 * [list(self.FIXED_INPUT)] + [list(self.TEST_INPUT)])
+
+    @mock.patch("krllint.linter.PARALLEL_MIN_FILES", 1)
+    def test_lint_files_with_jobs_and_fix(self):
+        with TemporaryDirectory() as dirname:
+            filenames = [os.path.join(dirname, name)
+                         for name in ("a.src", "b.dat", "c.sub")]
+            for filename in filenames:
+                with open(filename, "w") as content:
+                    content.writelines(self.TEST_INPUT)
+
+            cli_args = _PARSER.parse_args(
+                ["--fix", "--jobs", "2"] + filenames)
+            linter = Linter(cli_args, create_config())
+            linter.lint()
+
+            results = []
+            for filename in filenames:
+                with open(filename) as content:
+                    results.append(content.readlines())
+
+        self.assertEqual(linter._reporter.found_issues[Category.CONVENTION], 3)
+        self.assertEqual(linter._reporter.found_issues[Category.WARNING], 12)
+        self.assertEqual(results, 3 * [list(self.FIXED_INPUT)])
+
+    @mock.patch("krllint.linter.PARALLEL_MIN_FILES", 1)
+    def test_lint_overlapping_targets(self):
+        with TemporaryDirectory() as dirname:
+            filename = os.path.join(dirname, "a.src")
+            with open(filename, "w") as content:
+                content.writelines(self.TEST_INPUT)
+
+            for jobs in ("1", "2"):
+                with self.subTest(jobs=jobs):
+                    cli_args = _PARSER.parse_args(
+                        ["--jobs", jobs, dirname, filename,
+                         os.path.join(dirname, ".", "a.src")])
+                    linter = Linter(cli_args, create_config())
+                    linter.lint()
+
+                    reporter = linter._reporter
+                    self.assertEqual(
+                        reporter.found_issues[Category.CONVENTION], 1)
+                    self.assertEqual(
+                        reporter.found_issues[Category.WARNING], 4)
+
+    def test_lint_few_files_with_jobs(self):
+        with TemporaryDirectory() as dirname:
+            with open(os.path.join(dirname, "a.src"), "w") as content:
+                content.writelines(self.TEST_INPUT)
+
+            cli_args = _PARSER.parse_args(["--jobs", "2", dirname])
+            linter = Linter(cli_args, create_config())
+            with mock.patch("krllint.linter._find_files",
+                            wraps=_find_files) as find_files:
+                linter.lint()
+
+        find_files.assert_called_once()
+        self.assertEqual(linter._reporter.found_issues[Category.WARNING], 4)
+
+    def test_lint_file(self):
+        with TemporaryDirectory() as dirname:
+            filename = os.path.join(dirname, "a.src")
+            with open(filename, "w") as content:
+                content.writelines(self.TEST_INPUT)
+
+            cli_args = _PARSER.parse_args(["--fix", filename])
+            linter = Linter(cli_args, create_config())
+            lines, reporter = linter.lint_file(filename)
+
+        self.assertEqual(lines, list(self.FIXED_INPUT))
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 1)
+        self.assertEqual(len(reporter.messages), 5)
+
+    def test_cli_args_without_jobs(self):
+        cli_args = Namespace(generate_config=False, fix=False,
+                             target=["test_cli_args_without_jobs"])
+        linter = Linter(cli_args, create_config())
+
+        self.assertEqual(linter.jobs, 1)
+
+    def test_negative_jobs(self):
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+            _PARSER.parse_args(["--jobs", "-3", "test_negative_jobs"])
+
+    def test_identical_lines(self):
+        cli_args = _PARSER.parse_args(["test_identical_lines"])
+        linter = Linter(cli_args, create_config())
+        _, reporter = linter.lint_lines(
+            "test_identical_lines", 3 * ["foo  bar\n"])
+
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 3)
+        self.assertEqual(
+            [message.line_number for message in reporter.messages], [0, 1, 2])
+
+    def test_lint_same_lines_twice(self):
+        cli_args = _PARSER.parse_args(["--fix", "test_lint_same_lines_twice"])
+        linter = Linter(cli_args, create_config())
+        first_lines, reporter = linter.lint_lines(
+            "test_lint_same_lines_twice", self.TEST_INPUT)
+        first_messages = list(reporter.messages)
+        second_lines, reporter = linter.lint_lines(
+            "test_lint_same_lines_twice", self.TEST_INPUT)
+
+        self.assertEqual(first_lines, list(self.FIXED_INPUT))
+        self.assertEqual(second_lines, list(self.FIXED_INPUT))
+        self.assertIsNot(first_lines, second_lines)
+        self.assertEqual(reporter.messages, first_messages)
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 2)
+        self.assertEqual(reporter.found_issues[Category.WARNING], 8)
+
+    def test_disabled_rules_are_not_run(self):
+        rule = next(rule for rule in RULES["common"]
+                    if isinstance(rule, TrailingWhitespace))
+        checked_lines = []
+
+        def lint(line):
+            checked_lines.append(line)
+            return TrailingWhitespace.lint(rule, line)
+
+        cli_args = _PARSER.parse_args(["test_disabled_rules_are_not_run"])
+        with mock.patch.object(rule, "lint", lint):
+            linter = Linter(cli_args, create_config())
+            disabled_linter = Linter(cli_args, create_config(
+                DISABLE=["trailing-whitespace"]))
+
+        _, reporter = disabled_linter.lint_lines(
+            "test_disabled_rules_are_not_run", self.TEST_INPUT)
+
+        self.assertEqual(checked_lines, [])
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 0)
+        self.assertEqual(reporter.found_issues[Category.WARNING], 4)
+
+        _, reporter = linter.lint_lines(
+            "test_disabled_rules_are_not_run", self.TEST_INPUT)
+
+        self.assertEqual(checked_lines, list(self.TEST_INPUT))
+        self.assertEqual(reporter.found_issues[Category.CONVENTION], 1)
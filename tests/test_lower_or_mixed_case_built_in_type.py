@@ -1,21 +1,21 @@
 # -*- coding: utf-8 -*-
 
 from unittest import TestCase
-from importlib import reload
 
-from krllint import config
-from krllint.reporter import Category, MemoryReporter
+from krllint.reporter import Category
 from krllint.linter import _create_arg_parser, Linter
 
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
 class LowerOrMixedCaseBuiltInTestCase(TestCase):
-    TEST_INPUT = ["Int\n"]
-    FIXED_INPUT = ["INT\n"]
+    TEST_INPUT = ("Int\n",)
+    FIXED_INPUT = ("INT\n",)
 
     def test_rule_without_fix(self):
-        cli_args = _create_arg_parser().parse_args(["test_rule_without_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["test_rule_without_fix"])
+        linter = Linter(cli_args, create_config())
         lines, reporter = linter.lint_lines("test_rule_without_fix", self.TEST_INPUT)
 
         self.assertEqual(reporter.found_issues[Category.CONVENTION], 0)
@@ -24,7 +24,7 @@ class LowerOrMixedCaseBuiltInTestCase(TestCase):
         self.assertEqual(reporter.found_issues[Category.ERROR], 0)
         self.assertEqual(reporter.found_issues[Category.FATAL], 0)
 
-        self.assertEqual(lines, self.TEST_INPUT)
+        self.assertEqual(lines, list(self.TEST_INPUT))
 
         self.assertEqual(reporter.messages[0].line_number, 0)
         self.assertEqual(reporter.messages[0].column, 0)
@@ -32,10 +32,8 @@ class LowerOrMixedCaseBuiltInTestCase(TestCase):
         self.assertEqual(reporter.messages[0].code, "wrong-case-type")
 
     def test_rule_with_fix(self):
-        cli_args = _create_arg_parser().parse_args(["--fix", "test_rule_with_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_fix"])
+        linter = Linter(cli_args, create_config())
         lines, _ = linter.lint_lines("test_rule_with_fix", self.TEST_INPUT)
 
-        self.assertEqual(lines, self.FIXED_INPUT)
+        self.assertEqual(lines, list(self.FIXED_INPUT))
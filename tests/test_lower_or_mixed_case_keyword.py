@@ -1,21 +1,21 @@
 # -*- coding: utf-8 -*-
 
 from unittest import TestCase
-from importlib import reload
 
-from krllint import config
-from krllint.reporter import Category, MemoryReporter
+from krllint.reporter import Category
 from krllint.linter import _create_arg_parser, Linter
 
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
 class LowerOrMixedCaseKeywordTestCase(TestCase):
-    TEST_INPUT = ["If\n"]
-    FIXED_INPUT = ["IF\n"]
+    TEST_INPUT = ("If\n",)
+    FIXED_INPUT = ("IF\n",)
 
     def test_rule_without_fix(self):
-        cli_args = _create_arg_parser().parse_args(["test_rule_without_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["test_rule_without_fix"])
+        linter = Linter(cli_args, create_config())
         lines, reporter = linter.lint_lines("test_rule_without_fix", self.TEST_INPUT)
 
         self.assertEqual(reporter.found_issues[Category.CONVENTION], 0)
@@ -24,7 +24,7 @@ class LowerOrMixedCaseKeywordTestCase(TestCase):
         self.assertEqual(reporter.found_issues[Category.ERROR], 0)
         self.assertEqual(reporter.found_issues[Category.FATAL], 0)
 
-        self.assertEqual(lines, self.TEST_INPUT)
+        self.assertEqual(lines, list(self.TEST_INPUT))
 
         self.assertEqual(reporter.messages[0].line_number, 0)
         self.assertEqual(reporter.messages[0].column, 0)
@@ -32,10 +32,18 @@ class LowerOrMixedCaseKeywordTestCase(TestCase):
         self.assertEqual(reporter.messages[0].code, "wrong-case-keyword")
 
     def test_rule_with_fix(self):
-        cli_args = _create_arg_parser().parse_args(["--fix", "test_rule_with_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_fix"])
+        linter = Linter(cli_args, create_config())
         lines, _ = linter.lint_lines("test_rule_with_fix", self.TEST_INPUT)
 
-        self.assertEqual(lines, self.FIXED_INPUT)
+        self.assertEqual(lines, list(self.FIXED_INPUT))
+
+    def test_rule_with_several_issues_and_fix(self):
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_several_issues_and_fix"])
+        linter = Linter(cli_args, create_config())
+        lines, reporter = linter.lint_lines("test_rule_with_several_issues_and_fix", ("if a then endif\n",))
+
+        self.assertEqual(reporter.found_issues[Category.WARNING], 3)
+        self.assertEqual(
+            [message.column for message in reporter.messages], [0, 5, 10])
+        self.assertEqual(lines, ["IF a THEN ENDIF\n"])
@@ -1,20 +1,21 @@
 # -*- coding: utf-8 -*-
 
-from unittest import TestCase
-from importlib import reload
+import re
+from unittest import TestCase, mock
 
-from krllint import config
-from krllint.reporter import Category, MemoryReporter
+from krllint.reporter import Category
 from krllint.linter import _create_arg_parser, Linter
 
+from . import create_config
+
+_PARSER = _create_arg_parser()
+
 class OpenTaskTestCase(TestCase):
-    TEST_INPUT = [";TODO This is a open task\n"]
+    TEST_INPUT = (";TODO This is a open task\n",)
 
     def test_rule_without_fix(self):
-        cli_args = _create_arg_parser().parse_args(["test_rule_without_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["test_rule_without_fix"])
+        linter = Linter(cli_args, create_config())
         lines, reporter = linter.lint_lines("test_rule_without_fix", self.TEST_INPUT)
 
         self.assertEqual(reporter.found_issues[Category.CONVENTION], 0)
@@ -23,7 +24,7 @@ class OpenTaskTestCase(TestCase):
         self.assertEqual(reporter.found_issues[Category.ERROR], 0)
         self.assertEqual(reporter.found_issues[Category.FATAL], 0)
 
-        self.assertEqual(lines, self.TEST_INPUT)
+        self.assertEqual(lines, list(self.TEST_INPUT))
 
         self.assertEqual(reporter.messages[0].line_number, 0)
         self.assertEqual(reporter.messages[0].column, 0)
@@ -31,10 +32,25 @@ class OpenTaskTestCase(TestCase):
         self.assertEqual(reporter.messages[0].code, "open-task")
 
     def test_rule_with_fix(self):
-        cli_args = _create_arg_parser().parse_args(["--fix", "test_rule_with_fix"])
-        reload(config)
-        config.REPORTER = MemoryReporter
-        linter = Linter(cli_args, config)
+        cli_args = _PARSER.parse_args(["--fix", "test_rule_with_fix"])
+        linter = Linter(cli_args, create_config())
         lines, _ = linter.lint_lines("test_rule_with_fix", self.TEST_INPUT)
 
-        self.assertEqual(lines, self.TEST_INPUT)
\ No newline at end of file
+        self.assertEqual(lines, list(self.TEST_INPUT))
+
+    def test_rule_with_header(self):
+        cli_args = _PARSER.parse_args(["test_rule_with_header"])
+        linter = Linter(cli_args, create_config())
+        _, reporter = linter.lint_lines("test_rule_with_header", ["&COMMENT TODO header task\n"])
+
+        self.assertEqual(reporter.found_issues[Category.WARNING], 1)
+        self.assertEqual(reporter.messages[0].message, "complete open task (header task)")
+
+    def test_rule_with_tuple_identifiers(self):
+        cli_args = _PARSER.parse_args(["test_rule_with_tuple_identifiers"])
+        linter = Linter(cli_args, create_config(OPEN_TASK_IDENTIFIERS=("TODO",)))
+        with mock.patch("krllint.rules.re.compile", wraps=re.compile) as compile_pattern:
+            _, reporter = linter.lint_lines("test_rule_with_tuple_identifiers", (";TODO first\n", ";TODO second\n"))
+
+        self.assertEqual(reporter.found_issues[Category.WARNING], 2)
+        compile_pattern.assert_called_once()
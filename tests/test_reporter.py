@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from io import StringIO
+from contextlib import redirect_stdout
+from unittest import TestCase, mock
+
+from krllint.reporter import (
+    Category, Message, TextReporter, ColorizedTextReporter)
+
+class CustomTextReporter(TextReporter):
+    def handle_new_file(self):
+        self._write(f"Checked {self.filename}")
+
+class CustomColorizedTextReporter(ColorizedTextReporter):
+    def handle_new_file(self):
+        self._write(self._colorize(f"Checked {self.filename}", self.WARNING))
+
+    def handle_warning(self, message):
+        self.handle_message(message, self.ERROR)
+
+def _report(reporter, messages):
+    output = StringIO()
+
+    with redirect_stdout(output):
+        reporter.start_file("foo.src")
+        for message in messages:
+            reporter.report(message)
+        reporter.finalize_file()
+
+    return output.getvalue()
+
+class TextReporterTestCase(TestCase):
+    def test_reporter_with_custom_new_file_handler(self):
+        reporter = CustomTextReporter()
+        output = StringIO()
+
+        with redirect_stdout(output):
+            reporter.start_file("foo.src")
+            reporter.report(Message(Category.WARNING, "foo", 9, 0, "foo"))
+            reporter.finalize_file()
+            reporter.start_file("bar.src")
+            reporter.report(Message(Category.WARNING, "bar", 0, 0, "bar"))
+            reporter.finalize_file()
+
+        self.assertEqual(output.getvalue(),
+                         "Checked foo.src\n"
+                         "10:1: foo [foo]\n"
+                         "Checked bar.src\n"
+                         "1:1: bar [bar]\n")
+
+@mock.patch("colorama.init")
+class ColorizedTextReporterTestCase(TestCase):
+    def test_reporter(self, _):
+        output = _report(ColorizedTextReporter(), [
+            Message(Category.CONVENTION, "foo", 0, 9, "foo"),
+            Message(Category.FATAL, "bar", 9, 0, "bar")
+        ])
+
+        self.assertEqual(output,
+                         "\033[33;7m***** foo.src\033[0m\n"
+                         "1:10: \033[1mfoo\033[0m [foo]\n"
+                         "10:1: \033[31;7;1mbar\033[0m [bar]\n")
+
+    def test_reporter_with_custom_styles(self, _):
+        output = _report(CustomColorizedTextReporter(), [
+            Message(Category.WARNING, "foo", 0, 0, "foo")
+        ])
+
+        self.assertEqual(output,
+                         "\033[35mChecked foo.src\033[0m\n"
+                         "1:1: \033[31;1mfoo\033[0m [foo]\n")